@@ -1,4 +1,5 @@
 import re
+from typing import Dict, Pattern
 
 from robotoff.utils.text import strip_consecutive_spaces
 
@@ -22,40 +23,43 @@ EXTRAWORDS_REGEX = {
 BRANDS_REGEX = re.compile(r"k bio|ja!|coop|belvita|carrefour|auchan|danone")
 
 
+def build_removal_regex(lang: str) -> Pattern:
+    """Combine all the patterns removed by `preprocess_name` for a given lang into
+    a single regex, so that the name is only scanned once."""
+    regexes = [
+        WEIGHT_REGEX,
+        BRANDS_REGEX,
+        LABELS_REGEX.get(lang),
+        EXTRAWORDS_REGEX.get(lang),
+    ]
+    return re.compile(
+        "|".join(
+            "(?:{})".format(regex.pattern) for regex in regexes if regex is not None
+        )
+    )
+
+
+REMOVAL_REGEX: Dict[str, Pattern] = {
+    lang: build_removal_regex(lang)
+    for lang in set(LABELS_REGEX) | set(EXTRAWORDS_REGEX)
+}
+DEFAULT_REMOVAL_REGEX = build_removal_regex("")
+
+
 def preprocess_name(name: str, lang: str) -> str:
     """Preprocess category name before matching:
     - remove all weight mentions (100 g, 1l,...)
+    - remove all brand mentions (Carrefour, Danone,...)
     - remove all label mentions (IGP, AOP, Label Rouge,...)
+    - remove all marketing words (gourmand, delicious,...)
+
+    All these mentions are removed in a single pass, with the regex returned by
+    `build_removal_regex` for the lang. Consecutive spaces are then collapsed.
 
     This preprocessing step increases recall, while not decreasing
     precision."""
     name = name.lower()
-    name = remove_weights(name)
-    name = remove_brands(name)
-    name = remove_labels(name, lang)
-    name = remove_marketing_words(name, lang)
+    name = REMOVAL_REGEX.get(lang, DEFAULT_REMOVAL_REGEX).sub("", name)
     name = strip_consecutive_spaces(name)
     name = name.strip()
     return name
-
-
-def remove_weights(name: str) -> str:
-    return WEIGHT_REGEX.sub("", name)
-
-
-def remove_brands(name: str) -> str:
-    return BRANDS_REGEX.sub("", name)
-
-
-def remove_marketing_words(name: str, lang: str) -> str:
-    if lang in EXTRAWORDS_REGEX:
-        name = EXTRAWORDS_REGEX[lang].sub("", name)
-
-    return name
-
-
-def remove_labels(name: str, lang: str) -> str:
-    if lang in LABELS_REGEX:
-        name = LABELS_REGEX[lang].sub("", name)
-
-    return name
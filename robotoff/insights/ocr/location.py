@@ -1,11 +1,11 @@
 import dataclasses
 import gzip
-import json
 from pathlib import Path
-import re
-from typing import BinaryIO, Iterable, List, Optional, Set, Tuple, Union
+import string
+from typing import BinaryIO, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-from flashtext import KeywordProcessor
+import ahocorasick
+import orjson
 
 from robotoff import settings
 from robotoff.insights._enum import InsightType
@@ -16,6 +16,11 @@ from robotoff.utils.cache import CachedStore
 from robotoff.utils.text import strip_accents_ascii
 
 
+# Characters considered as part of a word when matching city names, the same as
+# flashtext's default
+WORD_CHARACTERS = frozenset(string.ascii_letters + string.digits + "_")
+
+
 @dataclasses.dataclass(frozen=True)
 class City:
     """A city, storing its name, postal code and GPS coordinates."""
@@ -61,26 +66,30 @@ def load_cities_fr(source: Union[Path, BinaryIO, None] = None) -> Set[City]:
 
     # Load JSON content
     with gzip.open(source, "rb") as cities_file:
-        json_data = json.load(cities_file)
+        json_data = orjson.loads(cities_file.read())
 
-    # Create City objects
-    cities = []
+    # Create City objects, skipping duplicates before creating them
+    cities: Dict[Tuple[str, str, Optional[Tuple[float, float]]], City] = {}
     for item in json_data:
         city_data = item["fields"]
         name = city_data["nom_de_la_commune"].lower()
         postal_code = city_data["code_postal"]
+        coords = city_data.get("coordonnees_gps")
+        if coords is not None:
+            coords = tuple(coords)
+
+        key = (name, postal_code, coords)
+        if key in cities:
+            continue
+
         if not len(postal_code) == 5 or not postal_code.isdigit():
             raise ValueError(
                 "{!r}, invalid FR postal code for city {!r}, must be 5-digits "
                 "string".format(postal_code, name)
             )
-        coords = city_data.get("coordonnees_gps")
-        if coords is not None:
-            coords = tuple(coords)
-        cities.append(City(name, postal_code, coords))
+        cities[key] = City(name, postal_code, coords)
 
-    # Remove duplicates
-    return set(cities)
+    return set(cities.values())
 
 
 class AddressExtractor:
@@ -116,9 +125,10 @@ class AddressExtractor:
         self.postal_code_search_distance = postal_code_search_distance
         self.text_extract_distance = text_extract_distance
 
-        self.cities_processor = KeywordProcessor()
+        self.cities_automaton = ahocorasick.Automaton()
         for city in self.cities:
-            self.cities_processor.add_keyword(city.name, city)
+            self.cities_automaton.add_word(city.name, city)
+        self.cities_automaton.make_automaton()
 
     def extract_addresses(self, content: Union[str, OCRResult]) -> List[RawInsight]:
         """Extract addresses from the given OCR result.
@@ -191,6 +201,9 @@ class AddressExtractor:
     def find_city_names(self, text: str) -> List[Tuple[City, int, int]]:
         """Find all cities from the search set in the text.
 
+        Only whole words are matched. When several city names overlap, the
+        leftmost one is kept, and the longest one if they start at the same index.
+
         Args:
             text (str): Text to search city names in.
 
@@ -199,7 +212,29 @@ class AddressExtractor:
             text, with the start and end indices of their names locations in the
             text. Empty list if none found.
         """
-        return self.cities_processor.extract_keywords(text, span_info=True)
+        if self.cities_automaton.kind != ahocorasick.AHOCORASICK:
+            # No city to search for
+            return []
+
+        candidates = []
+        for last_index, city in self.cities_automaton.iter(text):
+            start = last_index - len(city.name) + 1
+            end = last_index + 1
+            # Only keep whole words
+            if (start == 0 or text[start - 1] not in WORD_CHARACTERS) and (
+                end == len(text) or text[end] not in WORD_CHARACTERS
+            ):
+                candidates.append((city, start, end))
+
+        candidates.sort(key=lambda match: (match[1], -match[2]))
+        matches = []
+        previous_end = 0
+        for city, start, end in candidates:
+            if start >= previous_end:
+                matches.append((city, start, end))
+                previous_end = end
+
+        return matches
 
     def find_nearby_postal_code(
         self, text: str, city: City, city_start: int, city_end: int
@@ -230,17 +265,23 @@ class AddressExtractor:
             )
             logger.error("postal code contains non-digit characters: %s", city)
             return None
-        pattern = r"(?:[^0-9]|^)({})(?:[^0-9]|$)".format(city.postal_code)
 
         sub_start = max(0, city_start - self.postal_code_search_distance)
         sub_end = min(len(text), city_end + self.postal_code_search_distance)
-        sub_text = text[sub_start:sub_end]
 
-        match = re.search(pattern, sub_text)
-        if match is None:
-            return None
-        else:
-            return match.group(1), sub_start + match.start(1), sub_start + match.end(1)
+        # Postal codes are fixed strings: search them with `str.find` rather than
+        # a regex, and check the surrounding characters by hand
+        postal_code = city.postal_code
+        pc_start = text.find(postal_code, sub_start, sub_end)
+        while pc_start != -1:
+            pc_end = pc_start + len(postal_code)
+            if (pc_start == sub_start or text[pc_start - 1] not in string.digits) and (
+                pc_end == sub_end or text[pc_end] not in string.digits
+            ):
+                return postal_code, pc_start, pc_end
+            pc_start = text.find(postal_code, pc_start + 1, sub_end)
+
+        return None
 
 
 ADDRESS_EXTRACTOR_STORE = CachedStore(
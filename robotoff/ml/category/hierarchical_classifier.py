@@ -17,6 +17,7 @@ from sklearn.feature_extraction.text import (
 )
 from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import train_test_split
+from sklearn.multiclass import OneVsRestClassifier
 from sklearn.pipeline import Pipeline
 from sklearn_hierarchical_classification.classifier import HierarchicalClassifier
 from sklearn_hierarchical_classification.constants import ROOT
@@ -210,7 +211,11 @@ class CategoryClassifier:
 
     @staticmethod
     def create_base_classifier():
-        return Pipeline([("tfidf", TfidfTransformer()), ("clf", LogisticRegression())])
+        # One binary classifier per class, trained in parallel on all cores
+        classifier = OneVsRestClassifier(
+            LogisticRegression(solver="saga", max_iter=200, tol=1e-3), n_jobs=-1
+        )
+        return Pipeline([("tfidf", TfidfTransformer()), ("clf", classifier)])
 
     @staticmethod
     def create_transformer():
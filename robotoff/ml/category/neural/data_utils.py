@@ -6,7 +6,7 @@ from tensorflow.keras.preprocessing.sequence import pad_sequences
 
 from .binarizer import MultiLabelBinarizer
 from .dataclass import TextPreprocessingConfig
-from .preprocess import preprocess_product_name, tokenize
+from .preprocess import preprocess_product_name, tokenize_batch
 
 UNK_TOKEN = "<UNK>"
 
@@ -56,13 +56,14 @@ def process_product_name(
     max_length: int,
     preprocessing_config: TextPreprocessingConfig,
 ):
-    tokens_all = [
-        tokenize(
-            preprocess_product_name(text, **dataclasses.asdict(preprocessing_config)),
-            nlp,
-        )
-        for text in product_names
-    ]
+    preprocessing_kwargs = dataclasses.asdict(preprocessing_config)
+    tokens_all = tokenize_batch(
+        (
+            preprocess_product_name(text, **preprocessing_kwargs)
+            for text in product_names
+        ),
+        nlp,
+    )
     tokens_int = [
         [token_to_int[t if t in token_to_int else UNK_TOKEN] for t in tokens]
         for tokens in tokens_all
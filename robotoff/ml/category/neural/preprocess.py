@@ -1,4 +1,5 @@
 import re
+from typing import Iterable, Iterator, List
 
 from robotoff.utils.text import strip_accents_ascii
 
@@ -26,5 +27,12 @@ def preprocess_product_name(
     return MULTIPLE_SPACES_REGEX.sub(" ", text)
 
 
-def tokenize(text: str, nlp):
-    return [token.orth_ for token in nlp(text)]
+def tokenize_batch(
+    texts: Iterable[str], nlp, batch_size: int = 1000
+) -> Iterator[List[str]]:
+    """Tokenize `texts` with `nlp`, processing them by batch with `nlp.pipe`.
+
+    A list of token strings is yielded for each text, lazily, so that the caller
+    does not need to keep the tokens of all texts in memory."""
+    for doc in nlp.pipe(texts, batch_size=batch_size):
+        yield [token.orth_ for token in doc]
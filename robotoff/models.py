@@ -16,20 +16,21 @@ db = PostgresqlExtDatabase(
 )
 
 
-def batch_insert(model_cls, data: Iterable[Dict], batch_size=100) -> int:
+def batch_insert(model_cls, data: Iterable[Dict], batch_size=1000) -> int:
     rows = 0
     inserts = []
 
-    for item in data:
-        inserts.append(item)
-        rows += 1
+    with db.atomic():
+        for item in data:
+            inserts.append(item)
+            rows += 1
 
-        if rows % batch_size == 0:
-            model_cls.insert_many(inserts).execute()
-            inserts = []
+            if rows % batch_size == 0:
+                model_cls.insert_many(inserts).execute()
+                inserts = []
 
-    if inserts:
-        model_cls.insert_many(inserts).execute()
+        if inserts:
+            model_cls.insert_many(inserts).execute()
 
     return rows
 
@@ -27,6 +27,15 @@ def strip_accents_ascii(s: str) -> str:
     strip_accents_unicode
         Remove accentuated char for any unicode symbol.
     """
+    try:
+        # Fast path: pure ASCII strings are left unchanged by NFKD normalization
+        # (`str.isascii` is not available on Python 3.6)
+        s.encode("ASCII")
+    except UnicodeEncodeError:
+        pass
+    else:
+        return s
+
     nkfd_form = unicodedata.normalize("NFKD", s)
     return nkfd_form.encode("ASCII", "ignore").decode("ASCII")
 
@@ -31,6 +31,7 @@ setup(
         "Pint==0.9",
         'dataclasses>=0.6;python_version<"3.7"',
         "flashtext==2.7",
+        "pyahocorasick==1.4.0",
         "langid==1.1.6",
         "more-itertools>=8.0.0,<9.0.0",
         "spacy>=2.2.0,<2.3.0",
@@ -12,6 +12,9 @@ from robotoff.elasticsearch.category.preprocessing import preprocess_name
         ("BEURRE IGP", "fr", "beurre"),
         ("poulet fermier label ROUGE", "fr", "poulet fermier"),
         ("Parmigiano Reggiano ", "it", "parmigiano reggiano"),
+        ("Baguette bio 250g Carrefour", "fr", "baguette"),
+        ("Delicious organic cookies 12 oz", "en", "cookies"),
+        ("Biscuits belvita 400 g", "pt", "biscuits"),
     ],
 )
 def test_preprocess_name(name: str, lang: str, expected: str):
@@ -1,4 +1,4 @@
-from flashtext import KeywordProcessor
+import ahocorasick
 import pytest
 
 from robotoff import settings
@@ -15,8 +15,8 @@ module = "robotoff.insights.ocr.location"
 
 def test_load_cities_fr(mocker):
     m_gzip_open = mocker.patch(f"{module}.gzip.open")
-    m_json_load = mocker.patch(
-        f"{module}.json.load",
+    m_json_loads = mocker.patch(
+        f"{module}.orjson.loads",
         return_value=[
             {
                 "fields": {
@@ -26,13 +26,24 @@ def test_load_cities_fr(mocker):
                 },
             },
             {"fields": {"nom_de_la_commune": "POYA", "code_postal": "98827"}},
+            # Duplicate with regard to City attributes
+            {
+                "fields": {
+                    "nom_de_la_commune": "PARIS",
+                    "code_postal": "75000",
+                    "coordonnees_gps": [48.866667, 2.333333],
+                    "ligne_5": "PARIS 01",
+                },
+            },
         ],
     )
 
     res = load_cities_fr()
 
     m_gzip_open.assert_called_once_with(settings.OCR_CITIES_FR_PATH, "rb")
-    m_json_load.assert_called_once_with(m_gzip_open.return_value.__enter__.return_value)
+    m_json_loads.assert_called_once_with(
+        m_gzip_open.return_value.__enter__.return_value.read.return_value
+    )
     assert res == {
         City("paris", "75000", (48.866667, 2.333333)),
         City("poya", "98827", None),
@@ -40,7 +51,7 @@ def test_load_cities_fr(mocker):
 
     # Error with postal code with bad length
     mocker.resetall()
-    m_json_load.return_value = [
+    m_json_loads.return_value = [
         {"fields": {"nom_de_la_commune": "YOLO", "code_postal": "123"}},
     ]
 
@@ -50,11 +61,13 @@ def test_load_cities_fr(mocker):
         load_cities_fr()
 
     m_gzip_open.assert_called_once_with(settings.OCR_CITIES_FR_PATH, "rb")
-    m_json_load.assert_called_once_with(m_gzip_open.return_value.__enter__.return_value)
+    m_json_loads.assert_called_once_with(
+        m_gzip_open.return_value.__enter__.return_value.read.return_value
+    )
 
     # Error with non-digit postal code
     mocker.resetall()
-    m_json_load.return_value = [
+    m_json_loads.return_value = [
         {"fields": {"nom_de_la_commune": "YOLO", "code_postal": "12A42"}},
     ]
 
@@ -64,7 +77,9 @@ def test_load_cities_fr(mocker):
         load_cities_fr()
 
     m_gzip_open.assert_called_once_with(settings.OCR_CITIES_FR_PATH, "rb")
-    m_json_load.assert_called_once_with(m_gzip_open.return_value.__enter__.return_value)
+    m_json_loads.assert_called_once_with(
+        m_gzip_open.return_value.__enter__.return_value.read.return_value
+    )
 
 
 def test_cities_fr_dataset():
@@ -91,15 +106,14 @@ def cities():
     return [City("paris", "75000", (48.866667, 2.333333)), City("poya", "98827", None)]
 
 
-def test_address_extractor_init(mocker, cities):
-    m_add_keyword = mocker.patch.object(KeywordProcessor, "add_keyword")
-
+def test_address_extractor_init(cities):
     ae = AddressExtractor(cities)
 
-    assert isinstance(ae.cities_processor, KeywordProcessor)
-    assert m_add_keyword.call_args_list == [
-        mocker.call("paris", cities[0]),
-        mocker.call("poya", cities[1]),
+    assert isinstance(ae.cities_automaton, ahocorasick.Automaton)
+    assert ae.cities_automaton.kind == ahocorasick.AHOCORASICK
+    assert sorted(ae.cities_automaton.items()) == [
+        ("paris", cities[0]),
+        ("poya", cities[1]),
     ]
 
 
@@ -144,6 +158,31 @@ def test_address_extractor_find_city_names():
         (c2, 5, 10),
         (c1, 15, 18),
     ]
+    assert ae.find_city_names("abcdef g abc_ def_g 1abc abc2") == []
+    assert ae.find_city_names("abc") == [(c1, 0, 3)]
+    assert ae.find_city_names("") == []
+
+    # Overlapping city names
+    c3 = City("def", "12345", None)
+    c4 = City("g abc", "12345", None)
+    ae = AddressExtractor([c1, c2, c3, c4])
+    assert ae.find_city_names("def g abc") == [(c2, 0, 5), (c1, 6, 9)]
+    assert ae.find_city_names("def gh abc") == [(c3, 0, 3), (c1, 7, 10)]
+
+    # Multi-word city names only match with the same separators
+    c5 = City("la pierre", "12345", None)
+    c6 = City("pierre levee", "77580", None)
+    ae = AddressExtractor([c5, c6])
+    assert ae.find_city_names("sarl dupont, la\npierre levee 77580") == [(c6, 16, 28)]
+    assert ae.find_city_names("(la)pierre levee") == [(c6, 4, 16)]
+    assert ae.find_city_names("la (pierre) levee") == []
+    c7 = City("le saint", "12345", None)
+    c8 = City("saint jean", "12345", None)
+    ae = AddressExtractor([c7, c8])
+    assert ae.find_city_names("produit par le\nsaint jean 12345") == [(c8, 15, 25)]
+
+    # No city to search for
+    assert AddressExtractor([]).find_city_names("abc") == []
 
 
 def test_address_extractor_find_nearby_postal_code(mocker):
@@ -158,6 +197,13 @@ def test_address_extractor_find_nearby_postal_code(mocker):
     assert ae.find_nearby_postal_code("12345 blah abc foo", c, 11, 14) is None
     # Search substring matching with postal code start
     assert ae.find_nearby_postal_code("foo 12345fr abc", c, 12, 15) == ("12345", 4, 9)
+    # First occurrence of the postal code is part of a longer number
+    ae_wide = AddressExtractor([c], postal_code_search_distance=20)
+    assert ae_wide.find_nearby_postal_code("abc 112345 12345", c, 0, 3) == (
+        "12345",
+        11,
+        16,
+    )
 
     # Invalid postal code (not 5 digits)
     m_get_logger = mocker.patch(f"{module}.get_logger")
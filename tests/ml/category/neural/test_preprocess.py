@@ -0,0 +1,13 @@
+from spacy.lang.fr import French
+
+from robotoff.ml.category.neural.preprocess import tokenize_batch
+
+
+def test_tokenize_batch():
+    nlp = French()
+    texts = ["Pâte à tartiner aux noisettes 750g", "", "l'eau minérale", "lait"]
+    expected = [[token.orth_ for token in nlp(text)] for text in texts]
+
+    assert list(tokenize_batch(texts, nlp)) == expected
+    assert list(tokenize_batch(texts, nlp, batch_size=2)) == expected
+    assert list(tokenize_batch([""], nlp)) == [[]]
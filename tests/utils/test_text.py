@@ -1,4 +1,4 @@
-from robotoff.utils.text import get_tag
+from robotoff.utils.text import get_tag, strip_accents_ascii
 
 import pytest
 
@@ -18,3 +18,17 @@ import pytest
 )
 def test_get_tag(value: str, output: str):
     assert get_tag(value) == output
+
+
+@pytest.mark.parametrize(
+    "value,output",
+    [
+        ("", ""),
+        ("reflets de france", "reflets de france"),
+        ("écrasé", "ecrase"),
+        ("l'île-àÉ$", "l'ile-aE$"),
+        ("TEXT É'-č", "TEXT E'-c"),
+    ],
+)
+def test_strip_accents_ascii(value: str, output: str):
+    assert strip_accents_ascii(value) == output